@@ -14,25 +14,16 @@ Environment overrides: STREAMLIT_HOST / STREAMLIT_PORT.
 
 from __future__ import annotations
 
+import argparse
+import io
 import os
 import sys
 import tempfile
 import numpy as np
-import soundfile as sf
 import streamlit as st
-from scipy.signal import sosfilt
 
-from src.design_fir import bandstop as fir_bandstop, lowpass as fir_lowpass, highpass as fir_highpass
-from src.design_iir import (
-    butter_bandstop,
-    butter_lowpass,
-    butter_highpass,
-    butter_notch,
-    parametric_eq,
-    shelving_lowshelf,
-    shelving_highshelf,
-)
-from src.plots import plot_freq_phase, plot_before_after_spectrogram
+# Heavy modules (soundfile, scipy, the filter/plot packages) are imported where
+# they are used, so launching the CLI and the empty landing page stay fast.
 
 
 def _resolve_host(host_option: str | None) -> str:
@@ -63,22 +54,15 @@ def run_app(argv: list[str] | None = None) -> None:
     """
     from streamlit.web import cli as stcli
 
-    args = list(sys.argv[1:] if argv is None else argv)
+    # Single pass over argv; unknown options are forwarded to Streamlit as-is
+    parser = argparse.ArgumentParser(add_help=False, allow_abbrev=False)
+    parser.add_argument("--host")
+    parser.add_argument("--port")
+    opts, args = parser.parse_known_args(sys.argv[1:] if argv is None else argv)
 
-    def pop_opt(option: str) -> str | None:
-        if option not in args:
-            return None
-        idx = args.index(option)
-        value = None
-        if idx + 1 < len(args):
-            value = args[idx + 1]
-            args.pop(idx + 1)
-        args.pop(idx)
-        return value
-
-    host_value = pop_opt("--host") or os.getenv("STREAMLIT_HOST")
+    host_value = opts.host or os.getenv("STREAMLIT_HOST")
     host = _resolve_host(host_value)
-    port_value = pop_opt("--port") or os.getenv("STREAMLIT_PORT")
+    port_value = opts.port or os.getenv("STREAMLIT_PORT")
 
     # Preserve any remaining extra args (e.g. --server.headless true) user passed.
     # Mark for the re-executed script that it's running under Streamlit.
@@ -89,6 +73,123 @@ def run_app(argv: list[str] | None = None) -> None:
     sys.argv.extend(args)
     sys.exit(stcli.main())
 
+
+@st.cache_data(max_entries=64)
+def design_filter(kind: str, *params: float) -> np.ndarray:
+    """Design a filter by name, memoized across Streamlit reruns.
+
+    Reruns triggered by unrelated widgets reuse the cached coefficients
+    instead of re-running the (Kaiser/bilinear) design routines. IIR designs
+    are returned in float64 so the plotted response is not distorted by
+    float32 rounding (filtering still runs on a float32 copy).
+    """
+    from src.design_fir import bandstop as fir_bandstop, lowpass as fir_lowpass, highpass as fir_highpass
+    from src.design_iir import (
+        butter_bandstop,
+        butter_lowpass,
+        butter_highpass,
+        butter_notch,
+        parametric_eq,
+        shelving_lowshelf,
+        shelving_highshelf,
+    )
+
+    fir_designers = {
+        "fir_bandstop": fir_bandstop,
+        "fir_lowpass": fir_lowpass,
+        "fir_highpass": fir_highpass,
+    }
+    if kind in fir_designers:
+        return fir_designers[kind](*params)
+
+    iir_designers = {
+        "butter_bandstop": butter_bandstop,
+        "butter_lowpass": butter_lowpass,
+        "butter_highpass": butter_highpass,
+        "butter_notch": butter_notch,
+        "parametric_eq": parametric_eq,
+        "shelving_lowshelf": shelving_lowshelf,
+        "shelving_highshelf": shelving_highshelf,
+    }
+    return iir_designers[kind](*params, dtype=np.float64)
+
+
+@st.cache_data(max_entries=16)
+def filter_signal(x: np.ndarray, h: np.ndarray | None = None, sos: np.ndarray | None = None) -> np.ndarray:
+    """Apply FIR taps ``h`` or IIR ``sos`` to ``x``, memoized across reruns."""
+    from src.fast_conv import apply_fir
+    from src.processing import apply_iir
+
+    if h is not None:
+        return apply_fir(x, h)
+    return apply_iir(x, sos)
+
+
+@st.cache_data(max_entries=32)
+def response_png(coeffs: np.ndarray, fs: float, is_sos: bool) -> bytes:
+    """Render the magnitude response of FIR taps or an SOS cascade to PNG bytes.
+
+    Cached so the response is only re-evaluated and re-drawn when the filter
+    itself changes, not on every widget interaction.
+    """
+    from scipy.signal import freqz, sosfreqz
+    import matplotlib.pyplot as plt
+
+    if is_sos:
+        w, h_resp = sosfreqz(coeffs, worN=4000, fs=fs)
+    else:
+        w, h_resp = freqz(coeffs, worN=4000, fs=fs)
+
+    # |H| -> dB in one buffer: abs, log10 and the scale all run in place
+    mag_db = np.abs(h_resp)
+    np.log10(mag_db, out=mag_db)
+    mag_db *= 20.0
+
+    fig, ax = plt.subplots(figsize=(12, 5))
+    ax.semilogx(w, mag_db, lw=2)
+    ax.axhline(-3, color='g', ls=':', label='−3 dB', alpha=0.5)
+    ax.axhline(-60, color='r', ls=':', label='−60 dB', alpha=0.5)
+    ax.set_title(f"{'IIR' if is_sos else 'FIR'} Filter Frequency Response", fontweight='bold')
+    ax.set_xlabel("Frequency (Hz)")
+    ax.set_ylabel("Magnitude (dB)")
+    ax.legend()
+    ax.grid(True, alpha=0.3, which='both')
+    ax.set_xlim(20, fs / 2)
+    if not is_sos:
+        ax.set_ylim(-100, 5)
+
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", dpi=200, bbox_inches="tight")
+    plt.close(fig)
+    return buf.getvalue()
+
+
+@st.cache_data(max_entries=16)
+def spectrogram_png(x: np.ndarray, y: np.ndarray, fs: float) -> bytes:
+    """Render the before/after spectrograms to PNG bytes at display resolution.
+
+    Only 0-8 kHz is shown, so both signals are decimated as long as the
+    anti-alias filter's passband (~0.8 of the new Nyquist) still covers
+    8 kHz, and the STFT hop is raised so that long uploads produce at most
+    ~4000 frames.
+    """
+    from scipy.signal import decimate
+    from src.plots import plot_before_after_spectrogram
+
+    q = max(1, int(fs // 20000))  # 0.8 * fs / (2 * q) >= 8 kHz
+    if q > 1:
+        x = decimate(x, q, ftype='fir')
+        y = decimate(y, q, ftype='fir')
+        fs = fs / q
+    hop_length = max(512, len(x) // 4000)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        spec_path = os.path.join(tmpdir, "before_after.png")
+        plot_before_after_spectrogram(x, y, fs, output_path=spec_path, hop_length=hop_length)
+        with open(spec_path, 'rb') as f:
+            return f.read()
+
+
 def app_main() -> None:
     st.set_page_config(page_title="Audio Filter Lab", layout="wide")
     st.title("Audio Filter Lab - Week 11")
@@ -119,15 +220,20 @@ def app_main() -> None:
     audio_file = st.file_uploader("Upload Audio File (WAV)", type=["wav"])
 
     if audio_file:
+        import soundfile as sf
+        from src.processing import normalize
+
         # Read audio
-        x, fs = sf.read(audio_file)
+        x, fs = sf.read(audio_file, dtype="float32")
 
         # Convert to mono if stereo
         if x.ndim > 1:
             x = x.mean(axis=1)
+        # Contiguous float32 keeps the FFT/sosfilt kernels on their no-copy path
+        x = np.ascontiguousarray(x, dtype=np.float32)
 
         # Normalize
-        x = x / (np.max(np.abs(x)) + 1e-8)
+        x = normalize(x)
 
         # Display original audio
         st.subheader("Original Audio")
@@ -152,24 +258,24 @@ def app_main() -> None:
             f1 = col1.slider("Stopband Low (Hz)", 20, int(fs/2) - 100, 900, step=10)
             f2 = col2.slider("Stopband High (Hz)", f1 + 10, int(fs/2), 1100, step=10)
             order = col3.slider("FIR Order", 33, 513, 129, step=16)
-            h = fir_bandstop(f1, f2, fs, numtaps=order)
-            y = np.convolve(x, h, mode="same")
+            h = design_filter("fir_bandstop", f1, f2, fs, order)
+            y = filter_signal(x, h=h)
             filter_sos = None
 
         elif filter_type == "FIR Lowpass":
             col1, col2 = st.columns(2)
             cutoff = col1.slider("Cutoff Frequency (Hz)", 20, int(fs/2) - 100, 1000, step=10)
             order = col2.slider("FIR Order", 33, 513, 129, step=16)
-            h = fir_lowpass(cutoff, fs, numtaps=order)
-            y = np.convolve(x, h, mode="same")
+            h = design_filter("fir_lowpass", cutoff, fs, order)
+            y = filter_signal(x, h=h)
             filter_sos = None
 
         elif filter_type == "FIR Highpass":
             col1, col2 = st.columns(2)
             cutoff = col1.slider("Cutoff Frequency (Hz)", 20, int(fs/2) - 100, 200, step=10)
             order = col2.slider("FIR Order", 33, 513, 129, step=16)
-            h = fir_highpass(cutoff, fs, numtaps=order)
-            y = np.convolve(x, h, mode="same")
+            h = design_filter("fir_highpass", cutoff, fs, order)
+            y = filter_signal(x, h=h)
             filter_sos = None
 
         elif filter_type == "IIR Bandstop (Butterworth)":
@@ -177,8 +283,8 @@ def app_main() -> None:
             f1 = col1.slider("Stopband Low (Hz)", 20, int(fs/2) - 100, 900, step=10)
             f2 = col2.slider("Stopband High (Hz)", f1 + 10, int(fs/2), 1100, step=10)
             order = col3.slider("Filter Order", 2, 10, 6)
-            sos = butter_bandstop(f1, f2, fs, order=order)
-            y = sosfilt(sos, x)
+            sos = design_filter("butter_bandstop", f1, f2, fs, order)
+            y = filter_signal(x, sos=sos)
             h = None
             filter_sos = sos
 
@@ -186,8 +292,8 @@ def app_main() -> None:
             col1, col2 = st.columns(2)
             cutoff = col1.slider("Cutoff Frequency (Hz)", 20, int(fs/2) - 100, 1000, step=10)
             order = col2.slider("Filter Order", 2, 10, 6)
-            sos = butter_lowpass(cutoff, fs, order=order)
-            y = sosfilt(sos, x)
+            sos = design_filter("butter_lowpass", cutoff, fs, order)
+            y = filter_signal(x, sos=sos)
             h = None
             filter_sos = sos
 
@@ -195,8 +301,8 @@ def app_main() -> None:
             col1, col2 = st.columns(2)
             cutoff = col1.slider("Cutoff Frequency (Hz)", 20, int(fs/2) - 100, 200, step=10)
             order = col2.slider("Filter Order", 2, 10, 6)
-            sos = butter_highpass(cutoff, fs, order=order)
-            y = sosfilt(sos, x)
+            sos = design_filter("butter_highpass", cutoff, fs, order)
+            y = filter_signal(x, sos=sos)
             h = None
             filter_sos = sos
 
@@ -204,8 +310,8 @@ def app_main() -> None:
             col1, col2 = st.columns(2)
             center = col1.slider("Center Frequency (Hz)", 50, 70, 60)
             bandwidth = col2.slider("Bandwidth (Hz)", 2, 20, 10)
-            sos = butter_notch(center, bandwidth, fs, order=4)
-            y = sosfilt(sos, x)
+            sos = design_filter("butter_notch", center, bandwidth, fs, 4)
+            y = filter_signal(x, sos=sos)
             h = None
             filter_sos = sos
 
@@ -214,8 +320,8 @@ def app_main() -> None:
             center = col1.slider("Center Frequency (Hz)", 100, 10000, 1000, step=10)
             gain_db = col2.slider("Gain (dB)", -12.0, 12.0, 6.0, step=0.5)
             q_factor = col3.slider("Q Factor", 0.5, 10.0, 2.0, step=0.1)
-            sos = parametric_eq(center, gain_db, q_factor, fs)
-            y = sosfilt(sos, x)
+            sos = design_filter("parametric_eq", center, gain_db, q_factor, fs)
+            y = filter_signal(x, sos=sos)
             h = None
             filter_sos = sos
 
@@ -223,8 +329,8 @@ def app_main() -> None:
             col1, col2 = st.columns(2)
             cutoff = col1.slider("Cutoff Frequency (Hz)", 50, 2000, 200, step=10)
             gain_db = col2.slider("Gain (dB)", -12.0, 12.0, 6.0, step=0.5)
-            sos = shelving_lowshelf(cutoff, gain_db, fs)
-            y = sosfilt(sos, x)
+            sos = design_filter("shelving_lowshelf", cutoff, gain_db, fs)
+            y = filter_signal(x, sos=sos)
             h = None
             filter_sos = sos
 
@@ -232,8 +338,8 @@ def app_main() -> None:
             col1, col2 = st.columns(2)
             cutoff = col1.slider("Cutoff Frequency (Hz)", 1000, 10000, 5000, step=10)
             gain_db = col2.slider("Gain (dB)", -12.0, 12.0, -6.0, step=0.5)
-            sos = shelving_highshelf(cutoff, gain_db, fs)
-            y = sosfilt(sos, x)
+            sos = design_filter("shelving_highshelf", cutoff, gain_db, fs)
+            y = filter_signal(x, sos=sos)
             h = None
             filter_sos = sos
 
@@ -243,13 +349,13 @@ def app_main() -> None:
             st.stop()
 
         # Normalize filtered output
-        y = y / (np.max(np.abs(y)) + 1e-8)
+        y = normalize(y)
 
         # Display filtered audio
         st.subheader("Filtered Audio")
         col1, col2 = st.columns([2, 1])
         with col1:
-            st.audio(y.astype(np.float32), format='audio/wav', sample_rate=fs)
+            st.audio(y, format='audio/wav', sample_rate=fs)
         with col2:
             if h is not None:
                 st.metric("Group Delay", f"~{len(h)//2 / fs * 1000:.1f} ms")
@@ -258,29 +364,26 @@ def app_main() -> None:
                 st.metric("Filter Type", "IIR (SOS)")
                 st.metric("Sections", len(filter_sos))
 
-        # Download button for filtered audio
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.wav') as tmp:
-            sf.write(tmp.name, y, fs)
-            with open(tmp.name, 'rb') as f:
-                st.download_button(
-                    label="Download Filtered Audio",
-                    data=f,
-                    file_name="filtered_audio.wav",
-                    mime="audio/wav",
-                )
-            os.unlink(tmp.name)
+        # Download button for filtered audio (encoded in memory, no temp file)
+        buf = io.BytesIO()
+        sf.write(buf, y, fs, format='WAV', subtype='PCM_16')
+        st.download_button(
+            label="Download Filtered Audio",
+            data=buf.getvalue(),
+            file_name="filtered_audio.wav",
+            mime="audio/wav",
+        )
 
         # Visualizations
+        from src.plots import plot_freq_phase
+
         st.subheader("Visualizations")
 
         viz_tabs = st.tabs(["Spectrograms", "Filter Response"])
 
         with viz_tabs[0]:
             st.write("### Before vs After Spectrograms")
-            with tempfile.TemporaryDirectory() as tmpdir:
-                spec_path = os.path.join(tmpdir, "before_after.png")
-                plot_before_after_spectrogram(x, y, fs, output_path=spec_path)
-                st.image(spec_path, use_container_width=True)
+            st.image(spectrogram_png(x, y, fs), use_container_width=True)
 
         with viz_tabs[1]:
             if h is not None and filter_sos is not None:
@@ -293,44 +396,11 @@ def app_main() -> None:
             elif h is not None:
                 # FIR only
                 st.write("### FIR Filter Frequency Response")
-                from scipy.signal import freqz
-                import matplotlib.pyplot as plt
-
-                w, h_resp = freqz(h, worN=4000, fs=fs)
-
-                fig, ax = plt.subplots(figsize=(12, 5))
-                ax.semilogx(w, 20 * np.log10(np.abs(h_resp)), lw=2)
-                ax.axhline(-3, color='g', ls=':', label='−3 dB', alpha=0.5)
-                ax.axhline(-60, color='r', ls=':', label='−60 dB', alpha=0.5)
-                ax.set_title("FIR Filter Frequency Response", fontweight='bold')
-                ax.set_xlabel("Frequency (Hz)")
-                ax.set_ylabel("Magnitude (dB)")
-                ax.legend()
-                ax.grid(True, alpha=0.3, which='both')
-                ax.set_xlim(20, fs / 2)
-                ax.set_ylim(-100, 5)
-                st.pyplot(fig)
-                plt.close()
+                st.image(response_png(h, fs, is_sos=False), use_container_width=True)
             elif filter_sos is not None:
                 # IIR only
                 st.write("### IIR Filter Frequency Response")
-                from scipy.signal import sosfreqz
-                import matplotlib.pyplot as plt
-
-                w, h_resp = sosfreqz(filter_sos, worN=4000, fs=fs)
-
-                fig, ax = plt.subplots(figsize=(12, 5))
-                ax.semilogx(w, 20 * np.log10(np.abs(h_resp)), lw=2)
-                ax.axhline(-3, color='g', ls=':', label='−3 dB', alpha=0.5)
-                ax.axhline(-60, color='r', ls=':', label='−60 dB', alpha=0.5)
-                ax.set_title("IIR Filter Frequency Response", fontweight='bold')
-                ax.set_xlabel("Frequency (Hz)")
-                ax.set_ylabel("Magnitude (dB)")
-                ax.legend()
-                ax.grid(True, alpha=0.3, which='both')
-                ax.set_xlim(20, fs / 2)
-                st.pyplot(fig)
-                plt.close()
+                st.image(response_png(filter_sos, fs, is_sos=True), use_container_width=True)
     else:
         st.info("Upload a WAV file to get started")
         st.markdown(
@@ -3,6 +3,9 @@
 This package provides comprehensive tools for audio filtering:
 - FIR filter design (design_fir.py)
 - IIR filter design (design_iir.py)
+- Fast FIR application (fast_conv.py)
+- IIR application and signal helpers (processing.py)
+- Streaming file filtering (streaming.py)
 - Plotting and visualization (plots.py)
 - Audio generation (generate.py)
 """
@@ -17,6 +20,9 @@ from .design_fir import (
     adaptive_numtaps,
 )
 
+# IIR filters - generic table-driven design
+from .design_iir import design as iir_design
+
 # IIR filters - Butterworth
 from .design_iir import (
     butter_lowpass,
@@ -62,6 +68,11 @@ from .design_iir import (
     shelving_highshelf,
 )
 
+# Filtering
+from .fast_conv import apply_fir, bandstop_polyphase, bandstop_polyphase_response
+from .processing import apply_iir, normalize, peak_abs
+from .streaming import sosfilt_file
+
 # Plotting utilities
 from .plots import (
     plot_freq_phase,
@@ -81,6 +92,9 @@ __all__ = [
     'fir_notch',
     'adaptive_numtaps',
     
+    # IIR generic
+    'iir_design',
+    
     # IIR Butterworth
     'butter_lowpass',
     'butter_highpass',
@@ -114,6 +128,15 @@ __all__ = [
     'shelving_lowshelf',
     'shelving_highshelf',
     
+    # Filtering
+    'apply_fir',
+    'apply_iir',
+    'peak_abs',
+    'normalize',
+    'bandstop_polyphase',
+    'bandstop_polyphase_response',
+    'sosfilt_file',
+    
     # Plotting
     'plot_freq_phase',
     'plot_phase_delay',
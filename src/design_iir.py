@@ -7,49 +7,141 @@ Provides common IIR filter designs with multiple filter types:
 - Elliptic/Cauer (ripple in both bands, sharpest transition)
 - Bessel (maximally flat group delay, linear phase)
 
-All functions return second-order sections (SOS) format for numerical stability.
+Every classic design goes through the table-driven ``design(kind, btype, ...)``;
+the named functions (``butter_lowpass`` etc.) are thin wrappers around it.
+
+All functions return second-order sections (SOS) format for numerical stability,
+as C-contiguous float32 arrays to match 32-bit float audio pipelines. Pass
+``dtype=np.float64`` to any design function to get double-precision sections.
 """
+from functools import lru_cache, partial, wraps
+import math
 from scipy.signal import butter, cheby1, cheby2, ellip, bessel
 import numpy as np
-from typing import Literal
+from typing import Callable, Literal
 
 
 FilterType = Literal['lowpass', 'highpass', 'bandpass', 'bandstop']
 
 
+def _cached_design(design: Callable[..., np.ndarray]) -> Callable[..., np.ndarray]:
+    """Memoize a design function on its (hashable, scalar) arguments.
+    
+    The cached SOS array is frozen and each call returns a fresh contiguous
+    copy in the requested ``dtype`` (float32 by default), so callers may
+    modify the result (scipy's sosfilt rejects read-only arrays).
+    """
+    @lru_cache(maxsize=128)
+    def frozen(*args, **kwargs) -> np.ndarray:
+        sos = np.asarray(design(*args, **kwargs))
+        sos.setflags(write=False)
+        return sos
+    
+    @wraps(design)
+    def wrapper(*args, dtype=np.float32, **kwargs) -> np.ndarray:
+        return np.array(frozen(*args, **kwargs), dtype=dtype, order='C')
+    
+    wrapper.cache_info = frozen.cache_info  # type: ignore[attr-defined]
+    wrapper.cache_clear = frozen.cache_clear  # type: ignore[attr-defined]
+    return wrapper
+
+
+# ==================== Generic Design ====================
+
+_DESIGNERS: dict[str, Callable[..., np.ndarray]] = {
+    'butter': butter,
+    'cheby1': cheby1,
+    'cheby2': cheby2,
+    'ellip': ellip,
+    'bessel': partial(bessel, norm='phase'),
+}
+
+# Ripple/attenuation arguments each family takes before the cutoff
+_EXTRA_ARGS: dict[str, tuple[str, ...]] = {
+    'cheby1': ('rp',),
+    'cheby2': ('rs',),
+    'ellip': ('rp', 'rs'),
+}
+
+
+@lru_cache(maxsize=128)
+def _design_sos(kind: str, btype: FilterType, cutoff: float | tuple[float, float], fs: float,
+                order: int, rp: float | None, rs: float | None) -> np.ndarray:
+    """Cached, read-only float64 SOS for ``design`` (positional so keys dedupe)."""
+    if kind not in _DESIGNERS:
+        raise ValueError(f"Unknown filter kind {kind!r}; expected one of {sorted(_DESIGNERS)}")
+    extra = {'rp': rp, 'rs': rs}
+    names = _EXTRA_ARGS.get(kind, ())
+    if any(extra[name] is None for name in names):
+        raise ValueError(f"{kind} designs require {' and '.join(names)}")
+    
+    nyq = fs / 2
+    wn = cutoff / nyq if np.ndim(cutoff) == 0 else [f / nyq for f in cutoff]  # type: ignore
+    sos = _DESIGNERS[kind](order, *(extra[name] for name in names), wn, btype=btype, output='sos')
+    sos.setflags(write=False)
+    return sos
+
+
+def design(kind: str, btype: FilterType, *, cutoff: float | tuple[float, float], fs: float,
+           order: int = 6, rp: float | None = None, rs: float | None = None,
+           dtype=np.float32) -> np.ndarray:
+    """Design a classic IIR filter by family and band type.
+    
+    Args:
+        kind: Filter family ('butter', 'cheby1', 'cheby2', 'ellip' or 'bessel')
+        btype: Band type ('lowpass', 'highpass', 'bandpass' or 'bandstop')
+        cutoff: Cutoff frequency in Hz, or (low, high) band edges for band filters
+        fs: Sampling frequency in Hz
+        order: Filter order
+        rp: Maximum passband ripple in dB (cheby1, ellip)
+        rs: Minimum stopband attenuation in dB (cheby2, ellip)
+        dtype: Output array dtype (float32 by default)
+    
+    Returns:
+        Second-order sections representation
+    """
+    if np.ndim(cutoff):
+        cutoff = tuple(cutoff)  # type: ignore
+    return np.array(_design_sos(kind, btype, cutoff, fs, order, rp, rs), dtype=dtype, order='C')
+
+
+design.cache_info = _design_sos.cache_info  # type: ignore[attr-defined]
+design.cache_clear = _design_sos.cache_clear  # type: ignore[attr-defined]
+
+
 # ==================== Butterworth Filters ====================
 
-def butter_lowpass(cutoff: float, fs: float, order: int = 6) -> np.ndarray:
+def butter_lowpass(cutoff: float, fs: float, order: int = 6, dtype=np.float32) -> np.ndarray:
     """Design a Butterworth lowpass filter.
     
     Args:
         cutoff: Cutoff frequency in Hz
         fs: Sampling frequency in Hz
         order: Filter order (higher = sharper transition)
+        dtype: Output array dtype (float32 by default)
     
     Returns:
         Second-order sections representation
     """
-    nyq = fs / 2
-    return butter(order, cutoff / nyq, btype='lowpass', output='sos')  # type: ignore
+    return design('butter', 'lowpass', cutoff=cutoff, fs=fs, order=order, dtype=dtype)
 
 
-def butter_highpass(cutoff: float, fs: float, order: int = 6) -> np.ndarray:
+def butter_highpass(cutoff: float, fs: float, order: int = 6, dtype=np.float32) -> np.ndarray:
     """Design a Butterworth highpass filter.
     
     Args:
         cutoff: Cutoff frequency in Hz
         fs: Sampling frequency in Hz
         order: Filter order
+        dtype: Output array dtype (float32 by default)
     
     Returns:
         Second-order sections representation
     """
-    nyq = fs / 2
-    return butter(order, cutoff / nyq, btype='highpass', output='sos')  # type: ignore
+    return design('butter', 'highpass', cutoff=cutoff, fs=fs, order=order, dtype=dtype)
 
 
-def butter_bandpass(f_low: float, f_high: float, fs: float, order: int = 6) -> np.ndarray:
+def butter_bandpass(f_low: float, f_high: float, fs: float, order: int = 6, dtype=np.float32) -> np.ndarray:
     """Design a Butterworth bandpass filter.
     
     Args:
@@ -57,15 +149,15 @@ def butter_bandpass(f_low: float, f_high: float, fs: float, order: int = 6) -> n
         f_high: Upper cutoff frequency in Hz
         fs: Sampling frequency in Hz
         order: Filter order
+        dtype: Output array dtype (float32 by default)
     
     Returns:
         Second-order sections representation
     """
-    nyq = fs / 2
-    return butter(order, [f_low / nyq, f_high / nyq], btype='bandpass', output='sos')  # type: ignore
+    return design('butter', 'bandpass', cutoff=(f_low, f_high), fs=fs, order=order, dtype=dtype)
 
 
-def butter_bandstop(f_low: float, f_high: float, fs: float, order: int = 6) -> np.ndarray:
+def butter_bandstop(f_low: float, f_high: float, fs: float, order: int = 6, dtype=np.float32) -> np.ndarray:
     """Design a Butterworth bandstop (notch) filter.
     
     Args:
@@ -73,15 +165,15 @@ def butter_bandstop(f_low: float, f_high: float, fs: float, order: int = 6) -> n
         f_high: Upper cutoff frequency in Hz
         fs: Sampling frequency in Hz
         order: Filter order
+        dtype: Output array dtype (float32 by default)
     
     Returns:
         Second-order sections representation
     """
-    nyq = fs / 2
-    return butter(order, [f_low / nyq, f_high / nyq], btype='bandstop', output='sos')  # type: ignore
+    return design('butter', 'bandstop', cutoff=(f_low, f_high), fs=fs, order=order, dtype=dtype)
 
 
-def butter_notch(center_freq: float, bandwidth: float, fs: float, order: int = 6) -> np.ndarray:
+def butter_notch(center_freq: float, bandwidth: float, fs: float, order: int = 6, dtype=np.float32) -> np.ndarray:
     """Design a Butterworth notch filter.
     
     Args:
@@ -89,18 +181,19 @@ def butter_notch(center_freq: float, bandwidth: float, fs: float, order: int = 6
         bandwidth: Bandwidth around center frequency in Hz
         fs: Sampling frequency in Hz
         order: Filter order
+        dtype: Output array dtype (float32 by default)
     
     Returns:
         Second-order sections representation
     """
     f_low = center_freq - bandwidth / 2
     f_high = center_freq + bandwidth / 2
-    return butter_bandstop(f_low, f_high, fs, order)
+    return design('butter', 'bandstop', cutoff=(f_low, f_high), fs=fs, order=order, dtype=dtype)
 
 
 # ==================== Chebyshev Type I Filters ====================
 
-def cheby1_lowpass(cutoff: float, fs: float, order: int = 6, ripple_db: float = 0.5) -> np.ndarray:
+def cheby1_lowpass(cutoff: float, fs: float, order: int = 6, ripple_db: float = 0.5, dtype=np.float32) -> np.ndarray:
     """Design a Chebyshev Type I lowpass filter (ripple in passband).
     
     Args:
@@ -108,15 +201,15 @@ def cheby1_lowpass(cutoff: float, fs: float, order: int = 6, ripple_db: float =
         fs: Sampling frequency in Hz
         order: Filter order
         ripple_db: Maximum passband ripple in dB
+        dtype: Output array dtype (float32 by default)
     
     Returns:
         Second-order sections representation
     """
-    nyq = fs / 2
-    return cheby1(order, ripple_db, cutoff / nyq, btype='lowpass', output='sos')  # type: ignore
+    return design('cheby1', 'lowpass', cutoff=cutoff, fs=fs, order=order, rp=ripple_db, dtype=dtype)
 
 
-def cheby1_highpass(cutoff: float, fs: float, order: int = 6, ripple_db: float = 0.5) -> np.ndarray:
+def cheby1_highpass(cutoff: float, fs: float, order: int = 6, ripple_db: float = 0.5, dtype=np.float32) -> np.ndarray:
     """Design a Chebyshev Type I highpass filter (ripple in passband).
     
     Args:
@@ -124,15 +217,15 @@ def cheby1_highpass(cutoff: float, fs: float, order: int = 6, ripple_db: float =
         fs: Sampling frequency in Hz
         order: Filter order
         ripple_db: Maximum passband ripple in dB
+        dtype: Output array dtype (float32 by default)
     
     Returns:
         Second-order sections representation
     """
-    nyq = fs / 2
-    return cheby1(order, ripple_db, cutoff / nyq, btype='highpass', output='sos')  # type: ignore
+    return design('cheby1', 'highpass', cutoff=cutoff, fs=fs, order=order, rp=ripple_db, dtype=dtype)
 
 
-def cheby1_bandpass(f_low: float, f_high: float, fs: float, order: int = 6, ripple_db: float = 0.5) -> np.ndarray:
+def cheby1_bandpass(f_low: float, f_high: float, fs: float, order: int = 6, ripple_db: float = 0.5, dtype=np.float32) -> np.ndarray:
     """Design a Chebyshev Type I bandpass filter (ripple in passband).
     
     Args:
@@ -141,15 +234,15 @@ def cheby1_bandpass(f_low: float, f_high: float, fs: float, order: int = 6, ripp
         fs: Sampling frequency in Hz
         order: Filter order
         ripple_db: Maximum passband ripple in dB
+        dtype: Output array dtype (float32 by default)
     
     Returns:
         Second-order sections representation
     """
-    nyq = fs / 2
-    return cheby1(order, ripple_db, [f_low / nyq, f_high / nyq], btype='bandpass', output='sos')  # type: ignore
+    return design('cheby1', 'bandpass', cutoff=(f_low, f_high), fs=fs, order=order, rp=ripple_db, dtype=dtype)
 
 
-def cheby1_bandstop(f_low: float, f_high: float, fs: float, order: int = 6, ripple_db: float = 0.5) -> np.ndarray:
+def cheby1_bandstop(f_low: float, f_high: float, fs: float, order: int = 6, ripple_db: float = 0.5, dtype=np.float32) -> np.ndarray:
     """Design a Chebyshev Type I bandstop filter (ripple in passband).
     
     Args:
@@ -158,17 +251,17 @@ def cheby1_bandstop(f_low: float, f_high: float, fs: float, order: int = 6, ripp
         fs: Sampling frequency in Hz
         order: Filter order
         ripple_db: Maximum passband ripple in dB
+        dtype: Output array dtype (float32 by default)
     
     Returns:
         Second-order sections representation
     """
-    nyq = fs / 2
-    return cheby1(order, ripple_db, [f_low / nyq, f_high / nyq], btype='bandstop', output='sos')  # type: ignore
+    return design('cheby1', 'bandstop', cutoff=(f_low, f_high), fs=fs, order=order, rp=ripple_db, dtype=dtype)
 
 
 # ==================== Chebyshev Type II Filters ====================
 
-def cheby2_lowpass(cutoff: float, fs: float, order: int = 6, attenuation_db: float = 40.0) -> np.ndarray:
+def cheby2_lowpass(cutoff: float, fs: float, order: int = 6, attenuation_db: float = 40.0, dtype=np.float32) -> np.ndarray:
     """Design a Chebyshev Type II lowpass filter (ripple in stopband).
     
     Args:
@@ -176,15 +269,15 @@ def cheby2_lowpass(cutoff: float, fs: float, order: int = 6, attenuation_db: flo
         fs: Sampling frequency in Hz
         order: Filter order
         attenuation_db: Minimum stopband attenuation in dB
+        dtype: Output array dtype (float32 by default)
     
     Returns:
         Second-order sections representation
     """
-    nyq = fs / 2
-    return cheby2(order, attenuation_db, cutoff / nyq, btype='lowpass', output='sos')  # type: ignore
+    return design('cheby2', 'lowpass', cutoff=cutoff, fs=fs, order=order, rs=attenuation_db, dtype=dtype)
 
 
-def cheby2_highpass(cutoff: float, fs: float, order: int = 6, attenuation_db: float = 40.0) -> np.ndarray:
+def cheby2_highpass(cutoff: float, fs: float, order: int = 6, attenuation_db: float = 40.0, dtype=np.float32) -> np.ndarray:
     """Design a Chebyshev Type II highpass filter (ripple in stopband).
     
     Args:
@@ -192,15 +285,15 @@ def cheby2_highpass(cutoff: float, fs: float, order: int = 6, attenuation_db: fl
         fs: Sampling frequency in Hz
         order: Filter order
         attenuation_db: Minimum stopband attenuation in dB
+        dtype: Output array dtype (float32 by default)
     
     Returns:
         Second-order sections representation
     """
-    nyq = fs / 2
-    return cheby2(order, attenuation_db, cutoff / nyq, btype='highpass', output='sos')  # type: ignore
+    return design('cheby2', 'highpass', cutoff=cutoff, fs=fs, order=order, rs=attenuation_db, dtype=dtype)
 
 
-def cheby2_bandstop(f_low: float, f_high: float, fs: float, order: int = 6, attenuation_db: float = 40.0) -> np.ndarray:
+def cheby2_bandstop(f_low: float, f_high: float, fs: float, order: int = 6, attenuation_db: float = 40.0, dtype=np.float32) -> np.ndarray:
     """Design a Chebyshev Type II bandstop filter (ripple in stopband).
     
     Args:
@@ -209,17 +302,17 @@ def cheby2_bandstop(f_low: float, f_high: float, fs: float, order: int = 6, atte
         fs: Sampling frequency in Hz
         order: Filter order
         attenuation_db: Minimum stopband attenuation in dB
+        dtype: Output array dtype (float32 by default)
     
     Returns:
         Second-order sections representation
     """
-    nyq = fs / 2
-    return cheby2(order, attenuation_db, [f_low / nyq, f_high / nyq], btype='bandstop', output='sos')  # type: ignore
+    return design('cheby2', 'bandstop', cutoff=(f_low, f_high), fs=fs, order=order, rs=attenuation_db, dtype=dtype)
 
 
 # ==================== Elliptic (Cauer) Filters ====================
 
-def ellip_lowpass(cutoff: float, fs: float, order: int = 6, ripple_db: float = 0.5, attenuation_db: float = 40.0) -> np.ndarray:
+def ellip_lowpass(cutoff: float, fs: float, order: int = 6, ripple_db: float = 0.5, attenuation_db: float = 40.0, dtype=np.float32) -> np.ndarray:
     """Design an elliptic lowpass filter (ripple in both bands, sharpest transition).
     
     Args:
@@ -228,15 +321,15 @@ def ellip_lowpass(cutoff: float, fs: float, order: int = 6, ripple_db: float = 0
         order: Filter order
         ripple_db: Maximum passband ripple in dB
         attenuation_db: Minimum stopband attenuation in dB
+        dtype: Output array dtype (float32 by default)
     
     Returns:
         Second-order sections representation
     """
-    nyq = fs / 2
-    return ellip(order, ripple_db, attenuation_db, cutoff / nyq, btype='lowpass', output='sos')  # type: ignore
+    return design('ellip', 'lowpass', cutoff=cutoff, fs=fs, order=order, rp=ripple_db, rs=attenuation_db, dtype=dtype)
 
 
-def ellip_highpass(cutoff: float, fs: float, order: int = 6, ripple_db: float = 0.5, attenuation_db: float = 40.0) -> np.ndarray:
+def ellip_highpass(cutoff: float, fs: float, order: int = 6, ripple_db: float = 0.5, attenuation_db: float = 40.0, dtype=np.float32) -> np.ndarray:
     """Design an elliptic highpass filter (ripple in both bands, sharpest transition).
     
     Args:
@@ -245,15 +338,15 @@ def ellip_highpass(cutoff: float, fs: float, order: int = 6, ripple_db: float =
         order: Filter order
         ripple_db: Maximum passband ripple in dB
         attenuation_db: Minimum stopband attenuation in dB
+        dtype: Output array dtype (float32 by default)
     
     Returns:
         Second-order sections representation
     """
-    nyq = fs / 2
-    return ellip(order, ripple_db, attenuation_db, cutoff / nyq, btype='highpass', output='sos')  # type: ignore
+    return design('ellip', 'highpass', cutoff=cutoff, fs=fs, order=order, rp=ripple_db, rs=attenuation_db, dtype=dtype)
 
 
-def ellip_bandstop(f_low: float, f_high: float, fs: float, order: int = 6, ripple_db: float = 0.5, attenuation_db: float = 40.0) -> np.ndarray:
+def ellip_bandstop(f_low: float, f_high: float, fs: float, order: int = 6, ripple_db: float = 0.5, attenuation_db: float = 40.0, dtype=np.float32) -> np.ndarray:
     """Design an elliptic bandstop filter (ripple in both bands, sharpest transition).
     
     Args:
@@ -263,47 +356,47 @@ def ellip_bandstop(f_low: float, f_high: float, fs: float, order: int = 6, rippl
         order: Filter order
         ripple_db: Maximum passband ripple in dB
         attenuation_db: Minimum stopband attenuation in dB
+        dtype: Output array dtype (float32 by default)
     
     Returns:
         Second-order sections representation
     """
-    nyq = fs / 2
-    return ellip(order, ripple_db, attenuation_db, [f_low / nyq, f_high / nyq], btype='bandstop', output='sos')  # type: ignore
+    return design('ellip', 'bandstop', cutoff=(f_low, f_high), fs=fs, order=order, rp=ripple_db, rs=attenuation_db, dtype=dtype)
 
 
 # ==================== Bessel Filters ====================
 
-def bessel_lowpass(cutoff: float, fs: float, order: int = 6) -> np.ndarray:
+def bessel_lowpass(cutoff: float, fs: float, order: int = 6, dtype=np.float32) -> np.ndarray:
     """Design a Bessel lowpass filter (maximally flat group delay, best phase response).
     
     Args:
         cutoff: Cutoff frequency in Hz
         fs: Sampling frequency in Hz
         order: Filter order
+        dtype: Output array dtype (float32 by default)
     
     Returns:
         Second-order sections representation
     """
-    nyq = fs / 2
-    return bessel(order, cutoff / nyq, btype='lowpass', output='sos', norm='phase')  # type: ignore
+    return design('bessel', 'lowpass', cutoff=cutoff, fs=fs, order=order, dtype=dtype)
 
 
-def bessel_highpass(cutoff: float, fs: float, order: int = 6) -> np.ndarray:
+def bessel_highpass(cutoff: float, fs: float, order: int = 6, dtype=np.float32) -> np.ndarray:
     """Design a Bessel highpass filter (maximally flat group delay, best phase response).
     
     Args:
         cutoff: Cutoff frequency in Hz
         fs: Sampling frequency in Hz
         order: Filter order
+        dtype: Output array dtype (float32 by default)
     
     Returns:
         Second-order sections representation
     """
-    nyq = fs / 2
-    return bessel(order, cutoff / nyq, btype='highpass', output='sos', norm='phase')  # type: ignore
+    return design('bessel', 'highpass', cutoff=cutoff, fs=fs, order=order, dtype=dtype)
 
 
-def bessel_bandpass(f_low: float, f_high: float, fs: float, order: int = 6) -> np.ndarray:
+def bessel_bandpass(f_low: float, f_high: float, fs: float, order: int = 6, dtype=np.float32) -> np.ndarray:
     """Design a Bessel bandpass filter (maximally flat group delay, best phase response).
     
     Args:
@@ -311,16 +404,17 @@ def bessel_bandpass(f_low: float, f_high: float, fs: float, order: int = 6) -> n
         f_high: Upper cutoff frequency in Hz
         fs: Sampling frequency in Hz
         order: Filter order
+        dtype: Output array dtype (float32 by default)
     
     Returns:
         Second-order sections representation
     """
-    nyq = fs / 2
-    return bessel(order, [f_low / nyq, f_high / nyq], btype='bandpass', output='sos', norm='phase')  # type: ignore
+    return design('bessel', 'bandpass', cutoff=(f_low, f_high), fs=fs, order=order, dtype=dtype)
 
 
 # ==================== Utility Functions ====================
 
+@_cached_design
 def parametric_eq(center_freq: float, gain_db: float, q_factor: float, fs: float) -> np.ndarray:
     """Design a parametric equalizer (peaking filter).
     
@@ -335,24 +429,25 @@ def parametric_eq(center_freq: float, gain_db: float, q_factor: float, fs: float
     Returns:
         Second-order sections representation (biquad coefficients)
     """
-    import math
-    
     A = 10 ** (gain_db / 40)
     w0 = 2 * math.pi * center_freq / fs
+    cos_w0 = math.cos(w0)
     alpha = math.sin(w0) / (2 * q_factor)
     
     b0 = 1 + alpha * A
-    b1 = -2 * math.cos(w0)
+    b1 = -2 * cos_w0
     b2 = 1 - alpha * A
     a0 = 1 + alpha / A
-    a1 = -2 * math.cos(w0)
+    a1 = b1
     a2 = 1 - alpha / A
     
-    # Normalize and convert to SOS format
-    sos = np.array([[b0/a0, b1/a0, b2/a0, 1.0, a1/a0, a2/a0]])
+    # Normalize (one reciprocal, six multiplies) and convert to SOS format
+    sos = np.array([[b0, b1, b2, a0, a1, a2]]) * (1.0 / a0)
+    sos[0, 3] = 1.0
     return sos
 
 
+@_cached_design
 def shelving_lowshelf(cutoff: float, gain_db: float, fs: float, q_factor: float = 0.707) -> np.ndarray:
     """Design a low-shelf filter (boost/cut low frequencies).
     
@@ -365,23 +460,25 @@ def shelving_lowshelf(cutoff: float, gain_db: float, fs: float, q_factor: float
     Returns:
         Second-order sections representation
     """
-    import math
-    
     A = 10 ** (gain_db / 40)
     w0 = 2 * math.pi * cutoff / fs
+    cos_w0 = math.cos(w0)
     alpha = math.sin(w0) / 2 * math.sqrt((A + 1/A) * (1/q_factor - 1) + 2)
+    two_sqrt_A_alpha = 2 * math.sqrt(A) * alpha
     
-    b0 = A * ((A+1) - (A-1)*math.cos(w0) + 2*math.sqrt(A)*alpha)
-    b1 = 2*A * ((A-1) - (A+1)*math.cos(w0))
-    b2 = A * ((A+1) - (A-1)*math.cos(w0) - 2*math.sqrt(A)*alpha)
-    a0 = (A+1) + (A-1)*math.cos(w0) + 2*math.sqrt(A)*alpha
-    a1 = -2 * ((A-1) + (A+1)*math.cos(w0))
-    a2 = (A+1) + (A-1)*math.cos(w0) - 2*math.sqrt(A)*alpha
+    b0 = A * ((A+1) - (A-1)*cos_w0 + two_sqrt_A_alpha)
+    b1 = 2*A * ((A-1) - (A+1)*cos_w0)
+    b2 = A * ((A+1) - (A-1)*cos_w0 - two_sqrt_A_alpha)
+    a0 = (A+1) + (A-1)*cos_w0 + two_sqrt_A_alpha
+    a1 = -2 * ((A-1) + (A+1)*cos_w0)
+    a2 = (A+1) + (A-1)*cos_w0 - two_sqrt_A_alpha
     
-    sos = np.array([[b0/a0, b1/a0, b2/a0, 1.0, a1/a0, a2/a0]])
+    sos = np.array([[b0, b1, b2, a0, a1, a2]]) * (1.0 / a0)
+    sos[0, 3] = 1.0
     return sos
 
 
+@_cached_design
 def shelving_highshelf(cutoff: float, gain_db: float, fs: float, q_factor: float = 0.707) -> np.ndarray:
     """Design a high-shelf filter (boost/cut high frequencies).
     
@@ -394,18 +491,19 @@ def shelving_highshelf(cutoff: float, gain_db: float, fs: float, q_factor: float
     Returns:
         Second-order sections representation
     """
-    import math
-    
     A = 10 ** (gain_db / 40)
     w0 = 2 * math.pi * cutoff / fs
+    cos_w0 = math.cos(w0)
     alpha = math.sin(w0) / 2 * math.sqrt((A + 1/A) * (1/q_factor - 1) + 2)
+    two_sqrt_A_alpha = 2 * math.sqrt(A) * alpha
     
-    b0 = A * ((A+1) + (A-1)*math.cos(w0) + 2*math.sqrt(A)*alpha)
-    b1 = -2*A * ((A-1) + (A+1)*math.cos(w0))
-    b2 = A * ((A+1) + (A-1)*math.cos(w0) - 2*math.sqrt(A)*alpha)
-    a0 = (A+1) - (A-1)*math.cos(w0) + 2*math.sqrt(A)*alpha
-    a1 = 2 * ((A-1) - (A+1)*math.cos(w0))
-    a2 = (A+1) - (A-1)*math.cos(w0) - 2*math.sqrt(A)*alpha
+    b0 = A * ((A+1) + (A-1)*cos_w0 + two_sqrt_A_alpha)
+    b1 = -2*A * ((A-1) + (A+1)*cos_w0)
+    b2 = A * ((A+1) + (A-1)*cos_w0 - two_sqrt_A_alpha)
+    a0 = (A+1) - (A-1)*cos_w0 + two_sqrt_A_alpha
+    a1 = 2 * ((A-1) - (A+1)*cos_w0)
+    a2 = (A+1) - (A-1)*cos_w0 - two_sqrt_A_alpha
     
-    sos = np.array([[b0/a0, b1/a0, b2/a0, 1.0, a1/a0, a2/a0]])
+    sos = np.array([[b0, b1, b2, a0, a1, a2]]) * (1.0 / a0)
+    sos[0, 3] = 1.0
     return sos
\ No newline at end of file
@@ -0,0 +1,144 @@
+"""Fast FIR application utilities.
+
+Provides "same"-mode FIR convolution tuned for audio-length signals:
+- Short filters use a direct ndimage convolution
+- Long filters use overlap-save FFT convolution with a cached taps spectrum
+- Narrow low-frequency bandstops run at a decimated rate via polyphase resampling
+"""
+from functools import lru_cache
+from scipy import ndimage
+from scipy.fft import irfft, next_fast_len, rfft
+from scipy.signal import resample_poly
+import numpy as np
+
+from .design_fir import bandpass
+
+
+# Filters shorter than this are cheaper to apply directly than through FFTs
+DIRECT_MAX_TAPS = 64
+
+
+@lru_cache(maxsize=32)
+def _taps_spectrum(taps_bytes: bytes, dtype: str, block_size: int) -> np.ndarray:
+    """rFFT of the FIR taps zero-padded to ``block_size``, cached per filter."""
+    taps = np.frombuffer(taps_bytes, dtype=dtype)
+    spectrum = rfft(taps, n=block_size)
+    spectrum.setflags(write=False)
+    return spectrum
+
+
+def overlap_save(signal: np.ndarray, taps: np.ndarray) -> np.ndarray:
+    """Convolve with overlap-save FFT blocks, matching ``np.convolve(..., mode="same")``.
+
+    All blocks are transformed in one batched, multithreaded rFFT call, and
+    the taps spectrum is reused across calls with the same filter.
+
+    Args:
+        signal: 1-D input signal
+        taps: FIR filter coefficients
+
+    Returns:
+        Filtered signal with the same length as the input
+    """
+    n, k = len(signal), len(taps)
+    block_size = next_fast_len(4 * k, real=True)
+    hop = block_size - k + 1
+    offset = (k - 1) // 2  # start of the "same" window in the full convolution
+    n_out = n + offset
+    n_blocks = -(-n_out // hop)
+
+    # k - 1 zeros of history in front, zeros after so every block is full length
+    padded = np.zeros((n_blocks - 1) * hop + block_size, dtype=signal.dtype)
+    padded[k - 1:k - 1 + n] = signal
+    blocks = np.lib.stride_tricks.sliding_window_view(padded, block_size)[::hop]
+
+    spectrum = _taps_spectrum(taps.tobytes(), taps.dtype.str, block_size)
+    filtered = irfft(rfft(blocks, axis=-1, workers=-1) * spectrum, n=block_size, axis=-1, workers=-1)
+
+    # The first k - 1 samples of each block are circular wrap-around; drop them
+    return filtered[:, k - 1:].reshape(-1)[offset:n_out]
+
+
+def apply_fir(signal: np.ndarray, taps: np.ndarray) -> np.ndarray:
+    """Apply an FIR filter to a signal using convolution.
+
+    Short filters use direct convolution in a single ndimage C loop; longer
+    ones use overlap-save FFT convolution, whose cost does not grow with the
+    number of taps. Both match ``np.convolve(signal, taps, mode="same")``.
+
+    Args:
+        signal: 1-D input signal
+        taps: FIR filter coefficients
+
+    Returns:
+        Filtered float32 signal with the same length as the input
+    """
+    signal = np.ascontiguousarray(signal, dtype=np.float32)
+    taps = np.ascontiguousarray(taps, dtype=np.float32)
+    if len(taps) < DIRECT_MAX_TAPS:
+        # Even-length kernels sit one sample left of ndimage's centre
+        return ndimage.convolve1d(signal, taps, mode="constant", cval=0.0,
+                                  origin=len(taps) % 2 - 1)
+    return overlap_save(signal, taps)
+
+
+def bandstop_polyphase(signal: np.ndarray, f_low: float, f_high: float, fs: float,
+                       numtaps: int = 257, beta: float = 8.0, low_rate: int = 1000) -> np.ndarray:
+    """Reject a low-frequency band (e.g. mains hum) at a decimated rate.
+    
+    The band is isolated with a bandpass FIR run on a polyphase-decimated
+    copy of the signal, resampled back to ``fs`` and subtracted. Every filter
+    in the chain is zero-phase, so the result is a linear-phase bandstop whose
+    taps run at ``low_rate`` instead of ``fs``.
+    
+    With ``beta=8`` the transition band is about ``5 * low_rate / numtaps`` wide
+    (~20 Hz for the defaults), so a narrower band gives a V-shaped notch, not
+    a flat stopband. For 55-65 Hz at 44.1 kHz: -54.6 dB at 60 Hz, -22 dB at
+    58/62 Hz and only -7.7 dB at the 55/65 Hz edges.
+    
+    Args:
+        signal: 1-D input signal
+        f_low: Lower band edge in Hz
+        f_high: Upper band edge in Hz (below ``low_rate / 2``)
+        fs: Sampling frequency in Hz
+        numtaps: Number of bandpass taps at the decimated rate
+        beta: Kaiser window beta parameter
+        low_rate: Approximate rate the bandpass runs at, in Hz (an integer
+            decimation factor keeps the polyphase resampling filters short)
+    
+    Returns:
+        Filtered float32 signal with the same length as the input
+    """
+    signal = np.ascontiguousarray(signal, dtype=np.float32)
+    factor = max(1, int(fs // low_rate))
+    taps = bandpass(f_low, f_high, fs / factor, numtaps, beta)
+    band = apply_fir(resample_poly(signal, 1, factor), taps)
+    band = resample_poly(band, factor, 1)[:len(signal)]
+    return np.subtract(signal, band, dtype=np.float32)
+
+
+def bandstop_polyphase_response(f_low: float, f_high: float, fs: float, numtaps: int = 257,
+                                beta: float = 8.0, low_rate: int = 1000) -> np.ndarray:
+    """Full-rate impulse response of ``bandstop_polyphase`` (e.g. for plotting).
+    
+    The decimate/interpolate chain is only approximately time-invariant, so
+    this is its response to an impulse aligned with the decimation phase,
+    trimmed to the span the bandpass can reach.
+    
+    Args:
+        f_low: Lower band edge in Hz
+        f_high: Upper band edge in Hz
+        fs: Sampling frequency in Hz
+        numtaps: Number of bandpass taps at the decimated rate
+        beta: Kaiser window beta parameter
+        low_rate: Approximate rate the bandpass runs at, in Hz
+    
+    Returns:
+        Odd-length, zero-phase (centred) FIR taps at ``fs``
+    """
+    factor = max(1, int(fs // low_rate))
+    # Cover the bandpass plus the resampling filters' support on both sides
+    half = factor * (numtaps // 2 + 11)
+    impulse = np.zeros(2 * half + 1, dtype=np.float32)
+    impulse[half] = 1.0
+    return bandstop_polyphase(impulse, f_low, f_high, fs, numtaps, beta, low_rate)
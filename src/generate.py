@@ -1,4 +1,4 @@
-"""Small audio generator (no external deps).
+"""Small audio generator (NumPy only).
 
 Creates 10-second WAV files in ../audio/:
 - hum_60hz.wav         : 60 Hz sine hum (10s)
@@ -6,81 +6,85 @@ Creates 10-second WAV files in ../audio/:
 - speech_like.wav      : a speech-like synthetic signal (10s)
 - mixed_with_hum.wav   : music + speech_like + low-level 60Hz hum (10s)
 
-Usage: python3 src/generate.py
+Generated components are cached in ../audio/.cache/ and input.wav is only
+rewritten when its generation parameters (recorded in input.wav.meta) change.
+
+Usage: python3 src/generate.py [--force]
 """
 from __future__ import annotations
+import glob
+import hashlib
+import json
 import math
 import os
-import random
+import sys
 import wave
-import struct
-from typing import List
+from typing import Callable, Sequence
+
+import numpy as np
 
 SR = 44100
 DURATION = 10.0
+SEED = 42
+AUDIO_DIR = os.path.join(os.path.dirname(__file__), '..', 'audio')
+CACHE_DIR = os.path.join(AUDIO_DIR, '.cache')
+# bump when the synthesis code changes so cached audio is regenerated
+CACHE_VERSION = 2
 
 
-def write_wav(path: str, samples: List[float], sr: int = SR) -> None:
+def write_wav(path: str, samples: Sequence[float] | np.ndarray, sr: int = SR) -> None:
     # normalize to int16
-    max_abs = max((abs(s) for s in samples), default=0.0)
+    arr = np.asarray(samples, dtype=np.float64)
+    max_abs = float(np.abs(arr).max()) if arr.size else 0.0
     if max_abs < 1e-9:
         max_abs = 1.0
     scale = 0.9 * 32767 / max_abs
+    # clip, then truncate toward zero like int(); WAV PCM is little-endian
+    pcm = np.clip(arr * scale, -32768, 32767).astype('<i2')
     os.makedirs(os.path.dirname(path), exist_ok=True)
     with wave.open(path, "wb") as wf:
         wf.setnchannels(1)
         wf.setsampwidth(2)
         wf.setframerate(sr)
-        frames = struct.pack('<' + 'h' * len(samples), *[int(max(-32768, min(32767, s * scale))) for s in samples])
-        wf.writeframes(frames)
+        wf.writeframes(pcm.tobytes())
 
 
-def sine_wave(freq: float, length: float, sr: int = SR, phase: float = 0.0, amp: float = 1.0) -> List[float]:
-    n = int(length * sr)
-    two_pi_f = 2.0 * math.pi * freq
-    return [amp * math.sin(two_pi_f * (i / sr) + phase) for i in range(n)]
+def sine_wave(freq: float, length: float, sr: int = SR, phase: float = 0.0, amp: float = 1.0) -> np.ndarray:
+    t = np.arange(int(length * sr)) / sr
+    return amp * np.sin(2.0 * math.pi * freq * t + phase)
 
 
-def generate_hum(sr: int = SR, duration: float = DURATION, freq: float = 60.0, amp: float = 0.05) -> List[float]:
+def generate_hum(sr: int = SR, duration: float = DURATION, freq: float = 60.0, amp: float = 0.05) -> np.ndarray:
     # add harmonics to hum for more realistic electrical hum
-    n = int(duration * sr)
-    out = [0.0] * n
-    for i in range(n):
-        t = i / sr
-        # fundamental + 2nd and 3rd harmonics
-        out[i] = amp * (
-            0.7 * math.sin(2 * math.pi * freq * t) +
-            0.2 * math.sin(2 * math.pi * 2 * freq * t) +
-            0.1 * math.sin(2 * math.pi * 3 * freq * t)
-        )
-    return out
+    t = np.arange(int(duration * sr)) / sr
+    w = 2 * math.pi * freq
+    # fundamental + 2nd and 3rd harmonics
+    return amp * (
+        0.7 * np.sin(w * t) +
+        0.2 * np.sin(2 * w * t) +
+        0.1 * np.sin(3 * w * t)
+    )
 
 
-def adsr_envelope(n: int, sr: int, a=0.01, d=0.05, s=0.6, r=0.1) -> List[float]:
+def adsr_envelope(n: int, sr: int, a=0.01, d=0.05, s=0.6, r=0.1) -> np.ndarray:
     # a,d,r are seconds. s is sustain level.
-    env = [0.0] * n
     a_n = max(1, int(a * sr))
     d_n = max(1, int(d * sr))
     r_n = max(1, int(r * sr))
     sustain_n = max(0, n - (a_n + d_n + r_n))
-    # attack
-    for i in range(a_n):
-        env[i] = (i / a_n)
-    # decay
-    for i in range(d_n):
-        env[a_n + i] = 1.0 - (1.0 - s) * (i / d_n)
-    # sustain
-    for i in range(sustain_n):
-        env[a_n + d_n + i] = s
-    # release
-    for i in range(r_n):
-        idx = a_n + d_n + sustain_n + i
-        if idx < n:
-            env[idx] = s * (1.0 - (i / r_n))
-    return env
-
-
-def generate_music(sr: int = SR, duration: float = DURATION) -> List[float]:
+    def ramp(k: int) -> np.ndarray:
+        return np.linspace(0.0, 1.0, k, endpoint=False)  # i / k for i < k
+
+    env = np.concatenate([
+        ramp(a_n),                     # attack
+        1.0 - (1.0 - s) * ramp(d_n),   # decay
+        np.full(sustain_n, s),         # sustain
+        s * (1.0 - ramp(r_n)),         # release
+    ])
+    return env[:n]
+
+
+def generate_music(sr: int = SR, duration: float = DURATION) -> np.ndarray:
     # richer melody with chord progression and multiple harmonics
     melody = [
         (440.0, 0.8), (494.0, 0.6), (523.25, 0.7), (587.33, 0.9),
@@ -88,31 +92,46 @@ def generate_music(sr: int = SR, duration: float = DURATION) -> List[float]:
         (440.0, 0.9), (392.0, 0.7), (349.23, 0.8), (329.63, 0.75),
         (293.66, 0.85), (329.63, 0.7), (349.23, 0.8), (440.0, 1.0)
     ]
+    # 5 harmonics for richer timbre (piano-like): (amplitude, phase)
+    harmonics = [(0.5, 0.0), (0.25, 0.3), (0.15, 0.7), (0.08, 1.1), (0.04, 1.5)]
     note_dur = duration / len(melody)
-    out: List[float] = []
+    n = int(note_dur * sr)
+    t = np.arange(n) / sr
+    env = adsr_envelope(n, sr, a=0.005, d=0.08, s=0.6, r=0.08)
+    # add subtle vibrato (same for every note)
+    env *= 1.0 + 0.004 * np.sin(2 * math.pi * 5.5 * t)
+    notes = []
     for freq, velocity in melody:
-        n = int(note_dur * sr)
-        env = adsr_envelope(n, sr, a=0.005, d=0.08, s=0.6, r=0.08)
-        for i in range(n):
-            t = i / sr
-            # add 5 harmonics for richer timbre (piano-like)
-            val = 0.0
-            val += 0.5 * math.sin(2 * math.pi * freq * t)
-            val += 0.25 * math.sin(2 * math.pi * 2 * freq * t + 0.3)
-            val += 0.15 * math.sin(2 * math.pi * 3 * freq * t + 0.7)
-            val += 0.08 * math.sin(2 * math.pi * 4 * freq * t + 1.1)
-            val += 0.04 * math.sin(2 * math.pi * 5 * freq * t + 1.5)
-            # add subtle vibrato
-            vibrato = 1.0 + 0.004 * math.sin(2 * math.pi * 5.5 * t)
-            out.append(val * env[i] * velocity * vibrato)
-    return out
+        # put each harmonic on its nearest FFT bin (< 1 Hz off) and synthesize
+        # the note with one inverse FFT: amp * sin(w*t + phase) <-> amp*n/2 * e^{i(phase - pi/2)}
+        spec = np.zeros(n // 2 + 1, dtype=complex)
+        for k, (amp, phase) in enumerate(harmonics, start=1):
+            spec[round(freq * k * n / sr)] += amp * n / 2 * np.exp(1j * (phase - math.pi / 2))
+        note = np.fft.irfft(spec, n)
+        note *= env
+        note *= velocity
+        notes.append(note)
+    return np.concatenate(notes)
+
+
+def _render_syllable(out: np.ndarray, start: int, source: np.ndarray, t: np.ndarray,
+                     formants: tuple, env: np.ndarray) -> None:
+    # shape the source with formant resonances and add it to out[start:] in place
+    f1, f2, f3 = formants
+    m = len(source)
+    formant_response = (
+        0.5 * np.sin(2 * math.pi * f1 * t) +
+        0.3 * np.sin(2 * math.pi * f2 * t) +
+        0.15 * np.sin(2 * math.pi * f3 * t)
+    )
+    out[start:start + m] += source * (1.0 + 0.6 * formant_response) * env[:m]
 
 
-def generate_speech_like(sr: int = SR, duration: float = DURATION) -> List[float]:
+def generate_speech_like(sr: int = SR, duration: float = DURATION) -> np.ndarray:
     # More realistic speech-like signal using formant synthesis
     n = int(duration * sr)
-    out: List[float] = [0.0] * n
-    random.seed(42)
+    out = np.zeros(n)
+    rng = np.random.default_rng(SEED)
     
     # vowel formants (F1, F2, F3) for more natural vowel sounds
     vowels = [
@@ -127,78 +146,110 @@ def generate_speech_like(sr: int = SR, duration: float = DURATION) -> List[float
     syllable_count = 18
     syll_dur = duration / syllable_count
     
+    # draw every random parameter up front (seeded, so still reproducible)
+    vowel_idx = rng.integers(len(vowels), size=syllable_count)
+    f0s = rng.uniform(110, 140, syllable_count)  # fundamental frequency (pitch)
+    phases = rng.uniform(0, 0.3, (syllable_count, 7))  # small random phase per harmonic
+    noise = rng.uniform(-1, 1, n)  # unvoiced source, sliced per syllable
+    burst_starts = (rng.uniform(0.1, duration - 0.1, 8) * sr).astype(int)
+    burst_lens = rng.integers(50, 151, 8)
+    burst_noise = rng.uniform(-1, 1, (8, 150))
+    
     for s_idx in range(syllable_count):
         start = int(s_idx * syll_dur * sr)
         length = int(syll_dur * sr)
+        m = min(length, n - start)  # samples that fit in the output
+        if m <= 0:
+            break
+        t = np.arange(m) / sr
         
         # vary envelope for voiced/unvoiced
         is_voiced = s_idx % 3 != 0
         if is_voiced:
             env = adsr_envelope(length, sr, a=0.008, d=0.02, s=0.4, r=0.03)
-            f1, f2, f3 = random.choice(vowels)
-            f0 = random.uniform(110, 140)  # fundamental frequency (pitch)
+            f1, f2, f3 = vowels[vowel_idx[s_idx]]
+            f0 = f0s[s_idx]
+            # voiced: harmonic source
+            source = np.zeros(m)
+            for h in range(1, 8):
+                source += np.sin(2 * math.pi * f0 * h * t + phases[s_idx, h - 1]) / h
+            source *= 0.15
         else:
-            # unvoiced consonant
+            # unvoiced consonant: use noise
             env = adsr_envelope(length, sr, a=0.002, d=0.01, s=0.15, r=0.015)
             f1, f2, f3 = 1500, 2500, 3500
-            f0 = 0
+            source = noise[start:start + m] * 0.3
         
-        for i in range(length):
-            pos = start + i
-            if pos >= n:
-                break
-            t = i / sr
-            
-            if is_voiced:
-                # voiced: use harmonic source
-                source = 0.0
-                for h in range(1, 8):
-                    amp = 1.0 / h
-                    source += amp * math.sin(2 * math.pi * f0 * h * t + random.uniform(0, 0.3))
-                source *= 0.15
-            else:
-                # unvoiced: use noise
-                source = random.uniform(-1, 1) * 0.3
-            
-            # apply formants as resonances
-            formant_response = (
-                0.5 * math.sin(2 * math.pi * f1 * t) +
-                0.3 * math.sin(2 * math.pi * f2 * t) +
-                0.15 * math.sin(2 * math.pi * f3 * t)
-            )
-            
-            signal = source * (1.0 + 0.6 * formant_response)
-            out[pos] += signal * env[i]
+        _render_syllable(out, start, source, t, (f1, f2, f3), env)
     
     # add consonant bursts for realism
-    for k in range(8):
-        idx = int(random.uniform(0.1, duration - 0.1) * sr)
-        burst_len = random.randint(50, 150)
-        for j in range(burst_len):
-            if idx + j < n:
-                out[idx + j] += 0.3 * (1.0 - j / burst_len) * random.uniform(-1, 1)
+    for idx, burst_len, burst in zip(burst_starts, burst_lens, burst_noise):
+        stop = min(burst_len, n - idx)
+        ramp = 1.0 - np.arange(stop) / burst_len
+        out[idx:idx + stop] += 0.3 * ramp * burst[:stop]
     
     return out
 
 
-def mix(signals: List[List[float]]) -> List[float]:
-    # mix lists (they may have slightly different lengths)
-    maxlen = max(len(s) for s in signals)
-    out = [0.0] * maxlen
+def mix(signals: Sequence[Sequence[float] | np.ndarray]) -> np.ndarray:
+    # mix signals (they may have slightly different lengths)
+    out = np.zeros(max(len(s) for s in signals))
     for s in signals:
-        for i, v in enumerate(s):
-            out[i] += v
+        s = np.asarray(s, dtype=np.float64)
+        out[:s.size] += s
     # scale down to avoid clipping
-    return [x / max(1.0, len(signals) * 0.9) for x in out]
+    out /= max(1.0, len(signals) * 0.9)
+    return out
+
+
+def _params_digest(params: dict) -> str:
+    return hashlib.sha256(json.dumps(params, sort_keys=True).encode()).hexdigest()[:16]
+
+
+def _cached(name: str, params: dict, make: Callable[[], np.ndarray],
+            force: bool = False) -> np.ndarray:
+    # reuse a component saved under the same parameters, else synthesize and save it;
+    # force always re-synthesizes, and a rewrite drops the component's older files
+    path = os.path.join(CACHE_DIR, f'{name}-{_params_digest(params)}.npy')
+    if not force and os.path.exists(path):
+        return np.load(path, mmap_mode='r')
+    out = make()
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    for stale in glob.glob(os.path.join(CACHE_DIR, f'{name}-*.npy')):
+        os.remove(stale)
+    np.save(path, out)
+    return out
+
+
+def _read_meta(path: str) -> dict | None:
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
 
+def main(force: bool | None = None) -> None:
+    # console-script entry points call main() bare, so read --force here
+    if force is None:
+        force = '--force' in sys.argv[1:]
+    out_path = os.path.join(AUDIO_DIR, 'input.wav')
+    meta_path = out_path + '.meta'
+    base = {'version': CACHE_VERSION, 'sr': SR, 'duration': DURATION}
+    hum_params = {'freq': 60.0, 'amp': 0.06}
+    meta = {**base, 'seed': SEED, 'hum': hum_params}
+    if not force and os.path.exists(out_path) and _read_meta(meta_path) == meta:
+        print("audio/input.wav is up to date (use --force to regenerate)")
+        return
 
-def main() -> None:
     print("Generating input.wav (10s, speech + music + 60Hz hum)")
-    hum = generate_hum(freq=60.0, amp=0.06)
-    music = generate_music()
-    speech = generate_speech_like()
+    hum = generate_hum(**hum_params)  # cheap, not worth caching
+    music = _cached('music', base, generate_music, force)
+    speech = _cached('speech', {**base, 'seed': SEED}, generate_speech_like, force)
     mixed = mix([music, speech, hum])
-    write_wav(os.path.join(os.path.dirname(__file__), '..', 'audio', 'input.wav'), mixed)
+    write_wav(out_path, mixed)
+    with open(meta_path, 'w') as f:
+        json.dump(meta, f, indent=2)
     print("Done. Created: audio/input.wav")
 
 
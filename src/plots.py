@@ -6,14 +6,95 @@ Provides functions for plotting:
 - Spectrograms and waveforms
 - Filter comparisons
 """
-import matplotlib.pyplot as plt
+from functools import lru_cache
 import numpy as np
-import librosa
-import librosa.display
+from scipy.fft import rfft, rfftfreq
 from scipy.signal import freqz, sosfreqz, group_delay
 import os
 
 
+# matplotlib and librosa are imported on first use, so importing the package
+# (e.g. only to design filters) does not pay for them
+def _pyplot():
+    """Import pyplot on first use (keeping whatever backend the caller chose)."""
+    import matplotlib.pyplot as plt
+    return plt
+
+
+@lru_cache(maxsize=32)
+def _cached_freqz(b_bytes: bytes, dtype: str, worN: int, fs: float):
+    """``freqz`` of FIR taps passed as raw bytes; results are read-only."""
+    w, h = freqz(np.frombuffer(b_bytes, dtype=dtype), worN=worN, fs=fs)
+    w.setflags(write=False)
+    h.setflags(write=False)
+    return w, h
+
+
+@lru_cache(maxsize=32)
+def _cached_sosfreqz(sos_bytes: bytes, dtype: str, shape: tuple, worN: int, fs: float):
+    """``sosfreqz`` of an SOS matrix passed as raw bytes; results are read-only."""
+    w, h = sosfreqz(np.frombuffer(sos_bytes, dtype=dtype).reshape(shape), worN=worN, fs=fs)
+    w.setflags(write=False)
+    h.setflags(write=False)
+    return w, h
+
+
+@lru_cache(maxsize=32)
+def _cached_group_delay(b_bytes: bytes, a_bytes: bytes, dtype: str, fs: float):
+    """``group_delay`` of a transfer function passed as raw bytes; results are read-only."""
+    w, gd = group_delay((np.frombuffer(b_bytes, dtype=dtype), np.frombuffer(a_bytes, dtype=dtype)), fs=fs)
+    w.setflags(write=False)
+    gd.setflags(write=False)
+    return w, gd
+
+
+def _freqz(b, worN: int, fs: float):
+    """Memoized ``freqz(b, worN=worN, fs=fs)``, keyed on the coefficient values."""
+    b = np.ascontiguousarray(b)
+    return _cached_freqz(b.tobytes(), b.dtype.str, worN, fs)
+
+
+def _sosfreqz(sos, worN: int, fs: float):
+    """Memoized ``sosfreqz(sos, worN=worN, fs=fs)``, keyed on the coefficient values."""
+    sos = np.ascontiguousarray(sos)
+    return _cached_sosfreqz(sos.tobytes(), sos.dtype.str, sos.shape, worN, fs)
+
+
+def _group_delay(b, a, fs: float):
+    """Memoized ``group_delay((b, a), fs=fs)``, keyed on the coefficient values."""
+    dtype = np.result_type(np.asarray(b), np.asarray(a))
+    b = np.ascontiguousarray(b, dtype=dtype)
+    a = np.ascontiguousarray(a, dtype=dtype)
+    return _cached_group_delay(b.tobytes(), a.tobytes(), dtype.str, fs)
+
+
+def _magnitude_db(h: np.ndarray) -> np.ndarray:
+    """``20 * log10(|h|)`` computed in one buffer."""
+    mag_db = np.abs(h)
+    np.log10(mag_db, out=mag_db)
+    mag_db *= 20
+    return mag_db
+
+
+def _amplitude_db(D: np.ndarray, amin: float = 1e-5, top_db: float = 80.0) -> np.ndarray:
+    """``librosa.amplitude_to_db(np.abs(D), ref=np.max)`` computed in one buffer."""
+    S_db = np.abs(D)
+    ref = max(float(S_db.max(initial=0.0)), amin)
+    np.maximum(S_db, amin, out=S_db)
+    np.log10(S_db, out=S_db)
+    S_db *= 20
+    S_db -= 20 * np.log10(ref)
+    np.maximum(S_db, S_db.max(initial=-np.inf) - top_db, out=S_db)
+    return S_db
+
+
+def _save(fig, output_path: str, dpi: int = 120):
+    """Lay out, save and close a figure (single render pass, screen resolution)."""
+    fig.tight_layout()
+    fig.savefig(output_path, dpi=dpi)
+    _pyplot().close(fig)
+
+
 def plot_freq_phase(h_fir, sos_iir, fs: float, output_path: str = "outputs/freq_resp.png"):
     """Plot frequency and phase response comparison of FIR and IIR filters.
     
@@ -23,19 +104,20 @@ def plot_freq_phase(h_fir, sos_iir, fs: float, output_path: str = "outputs/freq_
         fs: Sampling frequency in Hz
         output_path: Path to save the plot
     """
+    plt = _pyplot()
+    
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
     
     fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 10))
     
-    # FIR frequency response
-    w_fir, h_fir_resp = freqz(h_fir, worN=4000, fs=fs)
-    
-    # IIR frequency response
-    w_iir, h_iir_resp = sosfreqz(sos_iir, worN=4000, fs=fs)
+    # FIR and IIR frequency responses (an integer worN gives both the same
+    # linspace(0, fs/2, worN, endpoint=False) grid, and freqz its FFT path)
+    w, h_fir_resp = _freqz(h_fir, 4000, fs)
+    _, h_iir_resp = _sosfreqz(sos_iir, 4000, fs)
     
     # Magnitude plot
-    ax1.semilogx(w_fir, 20*np.log10(np.abs(h_fir_resp)), label='FIR (Kaiser)', lw=2)
-    ax1.semilogx(w_iir, 20*np.log10(np.abs(h_iir_resp)), '--', label='IIR (Butterworth)', lw=2)
+    ax1.semilogx(w, _magnitude_db(h_fir_resp), label='FIR (Kaiser)', lw=2)
+    ax1.semilogx(w, _magnitude_db(h_iir_resp), '--', label='IIR (Butterworth)', lw=2)
     ax1.axhline(-60, color='r', ls=':', label='−60 dB', alpha=0.5)
     ax1.axhline(-3, color='g', ls=':', label='−3 dB', alpha=0.5)
     ax1.set_title("Frequency Response (Magnitude)", fontsize=14, fontweight='bold')
@@ -47,8 +129,8 @@ def plot_freq_phase(h_fir, sos_iir, fs: float, output_path: str = "outputs/freq_
     ax1.set_ylim(-100, 5)
     
     # Phase plot
-    ax2.semilogx(w_fir, np.angle(h_fir_resp), label='FIR Phase', lw=2)
-    ax2.semilogx(w_iir, np.angle(h_iir_resp), '--', label='IIR Phase', lw=2)
+    ax2.semilogx(w, np.angle(h_fir_resp), label='FIR Phase', lw=2)
+    ax2.semilogx(w, np.angle(h_iir_resp), '--', label='IIR Phase', lw=2)
     ax2.set_title("Phase Response", fontsize=14, fontweight='bold')
     ax2.set_xlabel("Frequency (Hz)")
     ax2.set_ylabel("Phase (radians)")
@@ -56,9 +138,7 @@ def plot_freq_phase(h_fir, sos_iir, fs: float, output_path: str = "outputs/freq_
     ax2.grid(True, alpha=0.3, which='both')
     ax2.set_xlim(20, fs/2)
     
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
-    plt.close()
+    _save(fig, output_path)
     print(f"Saved frequency/phase response to {output_path}")
 
 
@@ -71,25 +151,24 @@ def plot_phase_delay(h_fir, sos_iir, fs: float, output_path: str = "outputs/phas
         fs: Sampling frequency in Hz
         output_path: Path to save the plot
     """
-    from scipy.signal import sos2tf
     import warnings
+    plt = _pyplot()
     
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
     
-    plt.figure(figsize=(12, 6))
+    fig = plt.figure(figsize=(12, 6))
     
     # FIR group delay
-    w_fir, gd_fir = group_delay((h_fir, [1]), fs=fs)
+    w_fir, gd_fir = _group_delay(h_fir, [1], fs)
     
-    # IIR group delay - convert SOS to transfer function first
-    # Suppress numerical warnings for very high-order filters
+    # IIR group delay - the delay of a cascade is the sum of its sections'
+    # delays, so the high-order transfer function is never formed
+    # Suppress warnings for zeros on the unit circle (e.g. notch sections)
+    w_iir, gd_iir = w_fir, np.zeros_like(gd_fir)
     with warnings.catch_warnings():
-        warnings.filterwarnings('ignore', category=UserWarning, message='.*denominator is extremely small.*')
-        b, a = sos2tf(sos_iir)
-        w_iir, gd_iir = group_delay((b, a), fs=fs)
-    
-    # Clip extreme values for better visualization
-    gd_iir = np.clip(gd_iir, 0, np.percentile(gd_iir[np.isfinite(gd_iir)], 99))
+        warnings.filterwarnings('ignore', category=UserWarning, message='.*group delay is singular.*')
+        for section in np.atleast_2d(sos_iir):
+            gd_iir += _group_delay(section[:3], section[3:], fs)[1]
     
     plt.plot(w_fir, gd_fir, label='FIR Group Delay', lw=2)
     plt.plot(w_iir, gd_iir, '--', label='IIR Group Delay', lw=2)
@@ -100,9 +179,7 @@ def plot_phase_delay(h_fir, sos_iir, fs: float, output_path: str = "outputs/phas
     plt.legend()
     plt.grid(True, alpha=0.3)
     plt.xlim(0, min(8000, fs/2))
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
-    plt.close()
+    _save(fig, output_path)
     print(f"Saved group delay to {output_path}")
 
 
@@ -116,13 +193,16 @@ def plot_spectrogram(audio: np.ndarray, fs: float, title: str = "Spectrogram",
         title: Plot title
         output_path: Path to save the plot
     """
+    import librosa
+    import librosa.display
+    plt = _pyplot()
+    
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
     
-    plt.figure(figsize=(14, 6))
+    fig = plt.figure(figsize=(14, 6))
     
     # Compute spectrogram
-    D = librosa.stft(audio)
-    S_db = librosa.amplitude_to_db(np.abs(D), ref=np.max)
+    S_db = _amplitude_db(librosa.stft(audio))
     
     # Plot
     img = librosa.display.specshow(S_db, sr=fs, x_axis='time', y_axis='hz', cmap='viridis')
@@ -131,9 +211,7 @@ def plot_spectrogram(audio: np.ndarray, fs: float, title: str = "Spectrogram",
     plt.xlabel("Time (s)")
     plt.ylabel("Frequency (Hz)")
     plt.ylim(0, min(8000, fs/2))
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
-    plt.close()
+    _save(fig, output_path)
     print(f"Saved spectrogram to {output_path}")
 
 
@@ -148,27 +226,31 @@ def plot_waveform(audio: np.ndarray, fs: float, title: str = "Waveform",
         output_path: Path to save the plot
         max_duration: Maximum duration to plot in seconds
     """
+    plt = _pyplot()
+    
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
     
     # Limit to max_duration
     max_samples = int(max_duration * fs)
     audio_plot = audio[:max_samples]
     
-    plt.figure(figsize=(14, 4))
-    time = np.arange(len(audio_plot)) / fs
-    plt.plot(time, audio_plot, lw=0.5, alpha=0.8)
+    # Thin to ~8000 vertices; the renderer cost scales with the vertex count
+    step = max(1, len(audio_plot) // 8000)
+    
+    fig = plt.figure(figsize=(14, 4))
+    time = np.arange(0, len(audio_plot), step) / fs
+    plt.plot(time, audio_plot[::step], lw=0.5, alpha=0.8, rasterized=True)
     plt.title(title, fontsize=14, fontweight='bold')
     plt.xlabel("Time (s)")
     plt.ylabel("Amplitude")
     plt.grid(True, alpha=0.3)
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
-    plt.close()
+    _save(fig, output_path)
     print(f"Saved waveform to {output_path}")
 
 
 def plot_before_after_spectrogram(before: np.ndarray, after: np.ndarray, fs: float,
-                                   output_path: str = "outputs/before_after_spec.png"):
+                                   output_path: str = "outputs/before_after_spec.png",
+                                   hop_length: int = 512):
     """Plot before/after spectrograms side by side.
     
     Args:
@@ -176,32 +258,41 @@ def plot_before_after_spectrogram(before: np.ndarray, after: np.ndarray, fs: flo
         after: Filtered audio signal
         fs: Sampling frequency in Hz
         output_path: Path to save the plot
+        hop_length: STFT hop in samples (raise it to bound the frame count)
     """
+    import librosa
+    import librosa.display
+    plt = _pyplot()
+    
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
     
     fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(14, 10))
     
+    # Both STFTs in one batched call when the signals line up; each panel
+    # keeps its own 0 dB reference
+    if len(before) == len(after):
+        D_before, D_after = librosa.stft(np.stack([before, after]), hop_length=hop_length)
+    else:
+        D_before = librosa.stft(before, hop_length=hop_length)
+        D_after = librosa.stft(after, hop_length=hop_length)
+    
     # Before
-    D_before = librosa.stft(before)
-    S_db_before = librosa.amplitude_to_db(np.abs(D_before), ref=np.max)
-    img1 = librosa.display.specshow(S_db_before, sr=fs, x_axis='time', y_axis='hz', 
-                                     cmap='viridis', ax=ax1)
+    S_db_before = _amplitude_db(D_before)
+    img1 = librosa.display.specshow(S_db_before, sr=fs, hop_length=hop_length, x_axis='time',
+                                     y_axis='hz', cmap='viridis', ax=ax1)
     ax1.set_title("Before Filtering", fontsize=14, fontweight='bold')
     ax1.set_ylim(0, min(8000, fs/2))
     fig.colorbar(img1, ax=ax1, format='%+2.0f dB')
     
     # After
-    D_after = librosa.stft(after)
-    S_db_after = librosa.amplitude_to_db(np.abs(D_after), ref=np.max)
-    img2 = librosa.display.specshow(S_db_after, sr=fs, x_axis='time', y_axis='hz', 
-                                     cmap='viridis', ax=ax2)
+    S_db_after = _amplitude_db(D_after)
+    img2 = librosa.display.specshow(S_db_after, sr=fs, hop_length=hop_length, x_axis='time',
+                                     y_axis='hz', cmap='viridis', ax=ax2)
     ax2.set_title("After Filtering", fontsize=14, fontweight='bold')
     ax2.set_ylim(0, min(8000, fs/2))
     fig.colorbar(img2, ax=ax2, format='%+2.0f dB')
     
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
-    plt.close()
+    _save(fig, output_path)
     print(f"Saved before/after spectrogram to {output_path}")
 
 
@@ -215,24 +306,34 @@ def plot_frequency_spectrum(audio: np.ndarray, fs: float, title: str = "Frequenc
         title: Plot title
         output_path: Path to save the plot
     """
+    plt = _pyplot()
+    
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
     
     # Compute FFT
-    fft = np.fft.rfft(audio)
-    magnitude = np.abs(fft)
-    freqs = np.fft.rfftfreq(len(audio), 1/fs)
+    spectrum = rfft(audio, workers=-1)
+    freqs = rfftfreq(len(audio), 1/fs)
+    
+    # Convert to dB in place
+    magnitude_db = np.abs(spectrum)
+    magnitude_db += 1e-10
+    np.log10(magnitude_db, out=magnitude_db)
+    magnitude_db *= 20
     
-    # Convert to dB
-    magnitude_db = 20 * np.log10(magnitude + 1e-10)
+    # Average into ~2000 log-spaced bins (skipping DC); the axis is far
+    # narrower than the FFT resolution at high frequencies
+    starts = np.unique(np.searchsorted(
+        freqs, np.geomspace(freqs[1], freqs[-1], 2000, endpoint=False)))
+    counts = np.diff(starts, append=len(freqs))
+    freqs = np.add.reduceat(freqs, starts) / counts
+    magnitude_db = np.add.reduceat(magnitude_db, starts) / counts
     
-    plt.figure(figsize=(14, 6))
-    plt.semilogx(freqs[1:], magnitude_db[1:], lw=1)
+    fig = plt.figure(figsize=(14, 6))
+    plt.semilogx(freqs, magnitude_db, lw=1, rasterized=True)
     plt.title(title, fontsize=14, fontweight='bold')
     plt.xlabel("Frequency (Hz)")
     plt.ylabel("Magnitude (dB)")
     plt.grid(True, alpha=0.3, which='both')
     plt.xlim(20, fs/2)
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
-    plt.close()
+    _save(fig, output_path)
     print(f"Saved frequency spectrum to {output_path}")
\ No newline at end of file
@@ -0,0 +1,33 @@
+"""Signal processing helpers shared by the demo script and the Streamlit app.
+
+Provides:
+- IIR filtering of a signal with second-order sections
+- Peak measurement and in-place peak normalization
+"""
+from scipy.linalg.blas import idamax, isamax
+from scipy.signal import sosfilt
+import numpy as np
+
+
+def apply_iir(signal: np.ndarray, sos: np.ndarray) -> np.ndarray:
+    """Apply an IIR filter to a signal using SOS form (float32 kernel)."""
+    sos = np.ascontiguousarray(sos, dtype=np.float32)
+    return np.asarray(sosfilt(sos, np.ascontiguousarray(signal, dtype=np.float32)))
+
+
+def peak_abs(signal: np.ndarray) -> float:
+    """Return max(|signal|) in one pass, without an abs() temporary."""
+    if signal.size == 0:
+        return 0.0
+    flat = signal.reshape(-1)  # BLAS wants a vector; only copies if non-contiguous
+    if flat.dtype == np.float32:
+        return abs(float(flat[isamax(flat)]))  # scipy's i?amax is 0-based
+    if flat.dtype == np.float64:
+        return abs(float(flat[idamax(flat)]))
+    return float(np.max(np.abs(signal)))
+
+
+def normalize(signal: np.ndarray) -> np.ndarray:
+    """Scale a float signal to unit peak amplitude in place and return it."""
+    signal *= 1.0 / (peak_abs(signal) + 1e-8)
+    return signal